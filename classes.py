@@ -1,4 +1,7 @@
-from .generic import Graph, plt
+from .generic import Graph, plt, _label_indexed_plain
+import numpy as np
+
+__all__ = ['FCGraph', 'GraphicalModel']
 
 _arrow_kwargs  = dict(head_width = 0.2, fc = 'k', length_includes_head = True)
 _input_kwargs  = dict(ec = 'k', fc = 'tab:green')
@@ -67,10 +70,23 @@ class FCGraph(Graph):
                  input_kwargs = _input_kwargs, hidden_kwargs = _hidden_kwargs, output_kwargs = _output_kwargs, arrow_kwargs = _arrow_kwargs,
                  bias_kwargs = _bias_kwargs, vertical = False, labels = 'xhy'):
         
-        self._set(locals())
+        self.n_input       = n_input
+        self.n_hidden      = n_hidden
+        self.n_output      = n_output
+        self.v_space       = v_space
+        self.h_space       = h_space
+        self.radius        = radius
+        self.bias          = bias
+        self.input_kwargs  = input_kwargs
+        self.hidden_kwargs = hidden_kwargs
+        self.output_kwargs = output_kwargs
+        self.arrow_kwargs  = arrow_kwargs
+        self.bias_kwargs   = bias_kwargs
+        self.vertical      = vertical
+        self.labels        = labels
         
-        xb_kwargs  = input_kwargs.copy(); xb_kwargs.update(bias_kwargs)
-        hb_kwargs  = hidden_kwargs.copy(); hb_kwargs.update(bias_kwargs)
+        xb_kwargs  = {**input_kwargs, **bias_kwargs}
+        hb_kwargs  = {**hidden_kwargs, **bias_kwargs}
         node_types = {'input' : input_kwargs, 'hidden' : hidden_kwargs, 'output' : output_kwargs, 'input_bias' : xb_kwargs, 'hidden_bias' : hb_kwargs}
         connection_types = {'normal' : arrow_kwargs}
         
@@ -86,30 +102,27 @@ class FCGraph(Graph):
         self.add_nodes(labels[2], n_output, len(n_hidden) + 1, 'output', **kwargs)
         
     def add_nodes(self, base, n, m, node_type = None, **kwargs):
-        bias = self.bias * (base != self.labels[2])
-        P    = []
+        h, v, add_node, add_conn = self.h_space, self.v_space, self._add_node, self._add_connection
+        bias   = self.bias * (base != self.labels[2])
+        hidden = base == self.labels[1]
+        prefix = f'{base}-{m}-' if hidden else f'{base}-'
+        prev   = self.__P
+        x      = m * h
+        ys     = (np.arange(n + bias) * v + v * (self._m - n - bias) / 2).tolist()
+        P      = []
         for j in range(n):
-            args  = (m, (j + 1)) if base == self.labels[1] else (j + 1,)
-            name  = f'{base}-{m}-{j}' if base == self.labels[1] else f'{base}-{j}'
-            label = self._gen_label(base, *args, bold = False)
-            self._add_node(name,
-                           (m * self.h_space, self.v_space * (j + (self._m - n - bias) / 2)),
-                           node_type = node_type,
-                           label = label,
-                           **kwargs)
-            if self.__P:
-                for p in self.__P:
-                    self._add_connection(p, name, 'normal')
+            args  = (m, j + 1) if hidden else (j + 1,)
+            name  = f'{prefix}{j}'
+            label = _label_indexed_plain(base, args)
+            add_node(name, (x, ys[j]), node_type = node_type, label = label, **kwargs)
+            for p in prev:
+                add_conn(p, name, 'normal')
             P.append(name)
         if bias:
-            j    += 1
-            name  = f'b-{m}-{j}' if base == self.labels[1] else f'b-{j}'
-            label = self._gen_label('b', m, bold = False)
-            self._add_node(name,
-                           (m * self.h_space, self.v_space * (j + (self._m - n - bias) / 2)),
-                           node_type = node_type + '_bias',
-                           label = label,
-                           **kwargs)
+            j     = n
+            name  = f'b-{m}-{j}' if hidden else f'b-{j}'
+            label = _label_indexed_plain('b', (m,))
+            add_node(name, (x, ys[j]), node_type = node_type + '_bias', label = label, **kwargs)
             P.append(name)
         self.__P = P
     
@@ -117,7 +130,6 @@ class FCGraph(Graph):
 _data_kwargs = dict(ec = 'k', fc = 'silver')
 _variable_kwargs = dict(ec = 'k', fc = 'none', ls = (0, (5, 5)))
 _function_kwargs = dict(ec = 'k', fc = 'none')
-_arrow_kwargs = dict(head_width = 0.2, length_includes_head = True, fc = 'k')
 
 class GraphicalModel(Graph):
     """
@@ -155,7 +167,11 @@ class GraphicalModel(Graph):
     def __init__(self, data_kwargs = _data_kwargs, variable_kwargs = _variable_kwargs, function_kwargs = _function_kwargs,
                  arrow_kwargs = _arrow_kwargs, radius = 0.8, annot = 20):
         
-        self._set(locals())
+        self.data_kwargs     = data_kwargs
+        self.variable_kwargs = variable_kwargs
+        self.function_kwargs = function_kwargs
+        self.arrow_kwargs    = arrow_kwargs
+        self.radius          = radius
         
         node_types = dict(data = data_kwargs, variable = variable_kwargs, function = function_kwargs)
         connection_types = {'normal' : arrow_kwargs}
@@ -163,5 +179,7 @@ class GraphicalModel(Graph):
         super().__init__(node_types = node_types, connection_types = connection_types, annot = annot)
         
     def add_node(self, name, xy, node_type, bold = True, **kwargs):
+        if name in self.nodes:
+            raise KeyError(name)
         label = self._gen_label(name, bold = bold)
         self._add_node(name, xy, node_type, radius = self.radius, label = label, **kwargs)
\ No newline at end of file
@@ -1,4 +1,23 @@
+from functools import lru_cache
+from itertools import chain
+from math import hypot
 from matplotlib import pyplot as plt
+from matplotlib.collections import EllipseCollection, PatchCollection, PolyCollection
+from matplotlib.patches import Circle as _PltCircle, FancyArrow, Rectangle, Wedge
+import numpy as np
+
+def _semi_label_offsets(radius, o = False):
+    """ Offsets of the left and right label positions from the center of a semi-circle """
+    h = radius / 2
+    return ((0, -h), (0, h)) if o else ((-h, 0), (h, 0))
+
+def _label_positions(center, label, offsets = None):
+    """ List of (xy, label) pairs for a circle, split across both halves at `offsets` from `center` if given """
+    if offsets is None:
+        return [(center, label)]
+    cx, cy = center
+    labels = label if isinstance(label, (tuple, list)) else (label, label)
+    return [((cx + ox, cy + oy), s) for (ox, oy), s in zip(offsets, labels)]
 
 class Circle():
     """
@@ -22,7 +41,7 @@ class Circle():
                       If "v" and `semi` = True, then lines drawn are relative to the north vector line.
                       
         label       : str
-                      Label of circle to be used with plt.annotate.
+                      Label of circle to be drawn at its center (or at the center of each half if `semi`).
                       
         semi        : bool, int
                       If `evaluated to not `False`, then use mpl.patches.Wedge to create two wedges to complete a circle.
@@ -32,80 +51,217 @@ class Circle():
         
     Methods
     ================
-        add         : (ax,)
+        add         : (ax, annotate)
                       Given an axes object `ax`, calls the ax.add_patch method with annotations if `label` was provided in the init.
+                      If `annotate` is False, or `annot_size` is 0, only the patches are added.
+                      
+        labels      : ()
+                      Returns a list of (xy, label) pairs describing where each label of the circle should be drawn.
+                      
+    Attributes
+    ================
+        patches     : list
+                      The patches making up the circle, [c] or the two wedges [l, r] if `semi`.
     """
+    __slots__ = ('xy', 'radius', 'ec', 'fc', 'orientation', 'label', 'semi', 'o', 'kwargs', 'annot_size', 'l', 'r', 'c', 'center',
+                 '_label_offsets')
+    
     def __init__(self, xy, radius, ec = 'k', fc = 'none', orientation = 'v', label = None, semi = False, **kwargs):
-        assert orientation in 'vh'
+        if orientation not in ('v', 'h'):
+            raise ValueError(orientation)
         if isinstance(semi, bool) and semi:
             semi = 90
         o = orientation == 'h'
-        for key, value in locals().items():
-            if key in ['self', '__class__']: continue
-            setattr(self, key, value)
+        self.xy          = xy
+        self.radius      = radius
+        self.ec          = ec
+        self.fc          = fc
+        self.orientation = orientation
+        self.label       = label
+        self.semi        = semi
+        self.o           = o
+        self.kwargs      = kwargs
         
-        if 'annot_size' in kwargs:
-            del kwargs['annot_size']
+        self.annot_size  = kwargs.pop('annot_size', 20)
             
         if semi:
-            if isinstance(kwargs, dict):
-                kwargs = kwargs.copy(), kwargs.copy()
-        
-            for var in ['label', 'ec', 'fc']:
-                if not isinstance(locals().get(var), (tuple, list)):
-                    for i in range(2):
-                        kwargs[i][var] = locals().get(var)
+            # Both halves share `kwargs`, only tuple/list values of label, ec and fc are split per side
+            left, right = [], []
+            for value in (label, ec, fc):
+                if isinstance(value, (tuple, list)):
+                    left.append(value[0])
+                    right.append(value[1])
                 else:
-                    for i in range(2):
-                        kwargs[i][var] = locals().get(var)[i]
+                    left.append(value)
+                    right.append(value)
+            
+            self._label_offsets = _semi_label_offsets(radius, o)
             
-            self.l = plt.matplotlib.patches.Wedge(xy, radius, semi * (1 - o), (360 - semi) * (1 + o), **kwargs[0])
-            self.r = plt.matplotlib.patches.Wedge(xy, radius, (360 - semi) * (1 + o), semi * (1 - o), **kwargs[1])
+            angle_a = semi * (1 - o)
+            angle_b = (360 - semi) * (1 + o)
+            self.l  = Wedge(xy, radius, angle_a, angle_b, label = left[0], ec = left[1], fc = left[2], **kwargs)
+            self.r  = Wedge(xy, radius, angle_b, angle_a, label = right[0], ec = right[1], fc = right[2], **kwargs)
         else:
-            self.c = plt.Circle(xy, radius, ec = ec, fc = fc, label = label, **kwargs)
+            self.c = _PltCircle(xy, radius, ec = ec, fc = fc, label = label, **kwargs)
             
         self.center = xy
         
-    def add(self, ax):
-        if self.semi:
-            ax.add_patch(self.l)
-            ax.add_patch(self.r)
-            l      = self.center[0] - (0 if self.o else self.radius / 2), self.center[1] - (self.radius / 2 if self.o else 0)
-            r      = self.center[0] + (0 if self.o else self.radius / 2), self.center[1] + (self.radius / 2 if self.o else 0)
-            for i, obj in enumerate([self.l, self.r]):
-                plt.annotate(obj.get_label(), [l, r][i], ha = 'center', va = 'center', size = self.annot_size)
-        else:
-            ax.add_patch(self.c)
-            plt.annotate(self.label, self.center, ha = 'center', va = 'center', size = self.annot_size)
+    @property
+    def patches(self):
+        return [self.l, self.r] if self.semi else [self.c]
+        
+    def labels(self):
+        return _label_positions(self.center, self.label, self._label_offsets if self.semi else None)
+        
+    def add(self, ax, annotate = True):
+        for patch in self.patches:
+            ax.add_patch(patch)
+        if annotate and self.annot_size:
+            for xy, label in self.labels():
+                if label is not None:
+                    ax.text(*xy, label, ha = 'center', va = 'center', size = self.annot_size)
+
+def _label_indexed_bold(base, args):
+    """ Bold LaTeX label for `base` indexed by the tuple `args` """
+    return f'$\\mathbf{{{base}}}_{{{",".join(map(str, args))}}}$'
+
+def _label_indexed_plain(base, args):
+    """ Plain LaTeX label for `base` indexed by the non-empty tuple `args` """
+    return f'${base}_{{{",".join(map(str, args))}}}$'
+
+def _label_bare(base):
+    """ Plain LaTeX label for `base` without indices """
+    return f'${base}$'
+
+_geometry_keys = {'radius', 'label', 'annot_size'}
+_patch_keys    = {'fc', 'ec', 'facecolor', 'edgecolor', 'color', 'lw', 'linewidth', 'ls', 'linestyle', 'alpha'} # kept by collections
+_circle_keys   = _geometry_keys | _patch_keys | {'semi', 'orientation'}
+_rect_keys     = _patch_keys | {'label'}
+
+def _patch_style(patch):
+    """ (facecolor, edgecolor, linewidth, linestyle) of `patch` """
+    return patch.get_facecolor(), patch.get_edgecolor(), patch.get_linewidth(), patch.get_linestyle()
+
+def _edge_geometry_numpy(centers, radii, src, dst):
+    """ (N, 4) array of arrow start points and vectors for edges `src` -> `dst`, trimmed to the node radii """
+    delta      = centers[dst] - centers[src]
+    dist       = np.hypot(delta[:, 0], delta[:, 1])
+    unit       = delta / dist[:, None]
+    out        = np.empty((len(src), 4))
+    out[:, :2] = centers[src] + radii[src, None] * unit
+    out[:, 2:] = unit * (dist - radii[src] - radii[dst])[:, None]
+    return out
+
+@lru_cache(maxsize = None)
+def _numba_edge_kernel():
+    """ Numba kernel computing the same edge geometry as _edge_geometry_numpy, None if numba is not installed """
+    try:
+        import numba
+    except ImportError:
+        return None
+    
+    @numba.njit(cache = True, parallel = True, fastmath = True)
+    def kernel(centers, radii, src, dst):
+        n   = src.shape[0]
+        out = np.empty((n, 4))
+        for i in numba.prange(n):
+            a, b   = src[i], dst[i]
+            dx     = centers[b, 0] - centers[a, 0]
+            dy     = centers[b, 1] - centers[a, 1]
+            d      = hypot(dx, dy)
+            ux, uy = dx / d, dy / d
+            diff   = d - radii[a] - radii[b]
+            out[i, 0] = centers[a, 0] + radii[a] * ux
+            out[i, 1] = centers[a, 1] + radii[a] * uy
+            out[i, 2] = ux * diff
+            out[i, 3] = uy * diff
+        return out
+    return kernel
+
+_numba_min_edges = 10 ** 6 # loading the kernel takes 0.25 s (cached) to 0.8 s (cold), about what NumPy takes for 10 ** 6 edges
+
+def _edge_geometry(centers, radii, src, dst):
+    """ Edge geometry from the Numba kernel when available and the graph is large enough, else from NumPy """
+    if len(src) >= _numba_min_edges:
+        kernel = _numba_edge_kernel() # numba is only imported once a graph this large is rendered
+        if kernel is not None:
+            return kernel(centers, radii, src, dst)
+    return _edge_geometry_numpy(centers, radii, src, dst)
+
+_arrow_shape_keys = {'width', 'head_width', 'head_length', 'length_includes_head', 'shape', 'overhang', 'head_starts_at_zero'}
+
+def _arrow_polygons(geom, width = 0.001, head_width = None, head_length = None, length_includes_head = False, shape = 'full',
+                    overhang = 0, head_starts_at_zero = False):
+    """ (N, K, 2) array of the FancyArrow(*row, ...) outline for every row of `geom`, mirroring FancyArrow._make_verts """
+    hw           = 3 * width if head_width is None else head_width
+    hl           = 1.5 * hw if head_length is None else head_length
+    x, y, dx, dy = geom.T
+    distance     = np.hypot(dx, dy)
+    
+    # Horizontal arrow pointing at (0, 0), one row per edge as only the length varies
+    half          = np.zeros((len(geom), 5, 2))
+    half[:, 1]    = -hl, -hw / 2
+    half[:, 2]    = -hl * (1 - overhang), -width / 2
+    half[:, 3, 0] = -(distance if length_includes_head else distance + hl)
+    half[:, 3, 1] = -width / 2
+    half[:, 4, 0] = half[:, 3, 0]
+    half[..., 0] += (0 if length_includes_head else hl) + (hl / 2 if head_starts_at_zero else 0)
+    if shape == 'left':
+        coords = half
+    else:
+        right  = half * [1, -1]
+        coords = right if shape == 'right' else np.concatenate([half[:, :-1], right[:, -2::-1]], axis = 1)
+        
+    # Rotate onto each edge and move the tip to the end of the edge
+    zero   = distance == 0
+    safe   = np.where(zero, 1, distance)
+    cx     = np.where(zero, 0, dx / safe)[:, None]
+    sx     = np.where(zero, 1, dy / safe)[:, None]
+    px, py = coords[..., 0], coords[..., 1]
+    return np.stack([px * cx - py * sx + (x + dx)[:, None], px * sx + py * cx + (y + dy)[:, None]], axis = -1)
+
+def _arrow_collection(geom, **kwargs):
+    """ PolyCollection drawing FancyArrow(*row, **kwargs) for every row of `geom` """
+    proto = FancyArrow(0, 0, 1, 0, **kwargs) # resolve colours and line style once
+    shape = {k : v for k, v in kwargs.items() if k in _arrow_shape_keys}
+    return PolyCollection(_arrow_polygons(geom, **shape), facecolors = [proto.get_facecolor()], edgecolors = [proto.get_edgecolor()],
+                          linewidths = [proto.get_linewidth()], linestyles = [proto.get_linestyle()])
+
+def _split_twin_kwargs(kwargs):
+    """ Splits `kwargs` into the kwargs of both halves of a twin arrow, (list, tuple) values give (first, second) """
+    k1, k2 = {}, {}
+    for key, value in kwargs.items():
+        k1[key], k2[key] = value if isinstance(value, (list, tuple)) else (value, value)
+    head_width  = k1.pop('head_width', 0.003) # plt.arrow default value
+    head_length = k1.pop('head_length', head_width * 1.5) # plt.arrow default value
+    k2.pop('head_width', None)
+    k2.pop('head_length', None)
+    return k1, k2, head_width, head_length
+
+def _add_patch(ax, patch):
+    """ Adds `patch` to `ax`, first detaching it from the figure of an earlier render """
+    if patch.axes is not None and patch.axes is not ax:
+        patch.remove()
+    return ax.add_patch(patch)
+
+def _draw_twins(ax, rows, kwargs):
+    """ Draws a twin arrow on `ax` for each (x, y, dx, dy) of `rows`, returning the patches drawn """
+    plt.sca(ax)
+    before = len(ax.patches)
+    for x, y, dx, dy in rows:
+        arrow(x, y, dx, dy, **kwargs)
+    return ax.patches[before:]
 
 def arrow(x, y, dx, dy, twin = False, **kwargs):
     """ Wrapper function for plt.arrow """
     if twin == 2:
-        for key, value in kwargs.copy().items():
-            if not isinstance(value, (list, tuple)):
-                kwargs[key] = (value, value)
-        k1, k2      = [{key : kwargs[key][i] for key in kwargs} for i in range(2)] 
-        head_width  = k1['head_width' ] if 'head_width' in k1 else 0.003 # plt.arrow default value
-        head_length = k1['head_length'] if 'head_length' in k1 else head_width * 1.5 # plt.arrow default value
-        for key in ['head_width', 'head_length']:
-            for k in [k1, k2]:
-                if key in k:
-                    del k[key]
+        k1, k2, head_width, head_length = _split_twin_kwargs(kwargs)
         plt.arrow(x, y, dx, dy, shape = 'left', head_width = head_width, head_length = head_length, **k1)
         plt.arrow(x + dx, y + dy, -dx, -dy, shape = 'right', head_width = -head_width, head_length = head_length, **k2)
     elif twin == 1:
-        for key, value in kwargs.copy().items():
-            if not isinstance(value, (list, tuple)):
-                kwargs[key] = (value, value)
-        k1, k2      = [{key : kwargs[key][i] for key in kwargs} for i in range(2)] 
-        head_width  = k1['head_width' ] if 'head_width' in k1 else 0.003
-        head_length = k1['head_length'] if 'head_length' in k1 else head_width * 1.5
-        for key in ['head_width', 'head_length']:
-            for k in [k1, k2]:
-                if key in k:
-                    del k[key]
+        k1, k2, head_width, head_length = _split_twin_kwargs(kwargs)
         plt.arrow(x, y, dx, dy)
-        d   = (dx ** 2 + dy ** 2) ** 0.5
+        d   = hypot(dx, dy)
         l   = head_length
         dx /= d
         dy /= d
@@ -146,111 +302,379 @@ class Graph():
                            type provided, find the relating `kwargs` to unpack. If `label_position` provided, display label at `label_position`
                            otherwise the center. `kwargs` will be unpacked into plt.Rectangle.
                            
-        render           : ()
-                           Renders the graph.
+        render           : (idle, reuse)
+                           Renders the graph. If `idle`, the canvas redraw is deferred to the event loop with draw_idle so that
+                           successive renders (e.g. in a notebook) coalesce into one draw. Batch pipelines that go straight to
+                           plt.savefig should leave `idle` as False. If `reuse`, the figure from the previous render (if still
+                           open) is cleared and drawn into instead of creating a new one.
+                           
+        update           : (positions, blit)
+                           Moves the nodes in `positions` ({name : xy} in plot coordinates) and updates the artists of the last render
+                           in place instead of rebuilding them, keeping the current view limits. If nodes, rectangles or connections were
+                           added since, the graph is rendered again into the same figure. If `blit` and the canvas supports it, only the
+                           moving artists are redrawn over a cached background, which is dropped again by any full redraw (e.g. pan,
+                           zoom or resize).
                            
     """
     def __init__(self, node_types = dict(), connection_types = dict(), rectangle_types = dict(), annot = 20):
         
-        self._set(locals())
+        self.node_types       = node_types
+        self.connection_types = connection_types
+        self.rectangle_types  = rectangle_types
+        self.annot            = annot
+        
+        self.nodes      = {}
+        self.rectangles = {}
+        
+        # Node geometry kept alongside `nodes` as parallel arrays (one row per node)
+        self._centers     = []
+        self._radii       = []
+        self._name_to_idx = {}
+        self._labels      = [] # (x, y, label, size) for every node label
+        self._label_node  = [] # index of the node each entry in `_labels` belongs to
+        
+        # Edges kept as parallel index arrays into the node arrays above, `_edge_type_id` indexes `_edge_types`
+        self._edge_src     = []
+        self._edge_dst     = []
+        self._edge_type_id = []
+        self._edge_pos     = {} # (src, dst) -> position in the edge arrays
+        self._edge_types   = []
+        self._type_id_of   = {}
         
-        self.nodes       = {}
-        self.rectangles  = {}
-        self.connections = {}
+        self.ax     = None
+        self._fig   = None
+        self._proto = {} # node_type -> style shared by nodes which only set geometry and label
+        
+        # Edge position -> (type id, FancyArrow), moved with set_data on later renders instead of being rebuilt
+        self._arrow_patches = {}
+        
+        # Artists built by the last render, moved in place by `update` instead of rebuilding the figure
+        self._artists    = None
+        self._background = None
+        self._draw_cid   = None # draw_event connection dropping `_background` on the current figure
         
         for d in [self.node_types, self.connection_types, self.rectangle_types]:
             d.update({None : {}})
-                                    
-    def _set(self, d, exceptions = ['self', '__class__']):
-        """ Set attributes """
-        for k, v in d.items():
-            if k in exceptions: pass
-            setattr(self, k, v)
             
+    @property
+    def connections(self):
+        """ {A : {B : connection_type}} rebuilt from the edge arrays """
+        names       = list(self._name_to_idx)
+        connections = {name : {} for name in names}
+        for a, b, t in zip(self._edge_src, self._edge_dst, self._edge_type_id):
+            connections[names[a]][names[b]] = self._edge_types[t]
+        return connections
+                                    
     def _add_node(self, name, xy, node_type = None, vertical = False, connect_to = None, connect_from = None, connection_type = None, **kwargs):
-        assert name not in self.nodes
-        c                      = Circle(xy[::-1] if vertical else xy, **self.node_types[node_type], **kwargs)
-        c.annot_size           = kwargs['annot_size'] if 'annot_size' in kwargs else self.annot # override if given
-        self.nodes[name]       = c
-        self.connections[name] = {}
+        nodes = self.nodes
+        # Circles are only built at render time, so only keep what is needed to build them
+        params      = {**self.node_types[node_type], **kwargs}
+        center      = xy[::-1] if vertical else xy
+        radius      = params['radius']
+        label       = params.get('label')
+        semi        = params.get('semi', False)
+        annot_size  = kwargs['annot_size'] if 'annot_size' in kwargs else self.annot # override if given
+        nodes[name] = dict(xy = center, radius = radius, type = node_type, label = label, semi = semi, kwargs = kwargs)
+        
+        self._name_to_idx[name] = len(self._centers)
+        self._centers.append(center)
+        self._radii.append(radius)
+        offsets = _semi_label_offsets(radius, params.get('orientation', 'v') == 'h') if semi else None
+        labels  = _label_positions(center, label, offsets)
+        if annot_size:
+            labels = [(*xy, s, annot_size) for xy, s in labels if s is not None]
+            self._labels.extend(labels)
+            self._label_node.extend([self._name_to_idx[name]] * len(labels))
         
         # Make iterable
         if isinstance(connect_to, str):
             connect_to   = [connect_to]
         if isinstance(connect_from, str):
-            connect_From = [connect_from]
+            connect_from = [connect_from]
             
-        # Loop both connections to and from `name`
-        for order, connections in zip((1,-1), (connect_to, connect_from)):
-            if connections:
-                for connection in connections:
-                    self._add_connection(*(connection, name)[::order], connection_type = connection_type)
+        # Loop both connections to and from `name` in one pass
+        add_conn = self._add_connection
+        for A, B in chain(((A, name) for A in connect_to or ()), ((name, B) for B in connect_from or ())):
+            add_conn(A, B, connection_type)
         
     def _add_connection(self, A, B, connection_type = None):
-        assert A in self.nodes and B in self.nodes
-        self.connections[A][B] = self.connection_types[connection_type]
+        # kwargs are looked up once per type at render time
+        edge = self._name_to_idx[A], self._name_to_idx[B]
+        if connection_type not in self._type_id_of:
+            if connection_type not in self.connection_types: # checked once per type
+                raise KeyError(connection_type)
+            self._type_id_of[connection_type] = len(self._edge_types)
+            self._edge_types.append(connection_type)
+        if edge in self._edge_pos:
+            self._edge_type_id[self._edge_pos[edge]] = self._type_id_of[connection_type]
+        else:
+            self._edge_pos[edge] = len(self._edge_src)
+            self._edge_src.append(edge[0])
+            self._edge_dst.append(edge[1])
+            self._edge_type_id.append(self._type_id_of[connection_type])
         
     def _add_rectangle(self, name, xy, width, height, rectangle_type = None, label_position = None, **kwargs):
-        assert name not in self.rectangles
-        r = plt.Rectangle(xy, width, height, **self.rectangle_types[rectangle_type], **kwargs)
+        r = Rectangle(xy, width, height, **self.rectangle_types[rectangle_type], **kwargs)
         r.label_position = (xy[0] + width / 2, xy[1] + height / 2) if label_position is None else label_position
+        r.batched        = self.rectangle_types[rectangle_type].keys() <= _rect_keys and kwargs.keys() <= _rect_keys
         self.rectangles[name] = r
         
-    def _gen_label(self, base, *args, bold = True):
-        ix = ','.join(map(str, args))
-        return '$\mathbf{' + str(base) + '}_{' + ix + '}$' if bold else f'${base}_' + '{' + ix + '}$' if ix else f'${base}$'
+    def _build_circle(self, node):
+        """ Circle for the node record `node` """
+        return Circle(node['xy'], **{**self.node_types[node['type']], **node['kwargs']})
+        
+    def _batchable(self, node):
+        """ True if every kwarg of the node record `node` can be represented by a collection """
+        return node['kwargs'].keys() <= _circle_keys and self.node_types[node['type']].keys() <= _circle_keys
+        
+    def _node_style(self, node):
+        """ (facecolor, edgecolor, linewidth, linestyle) of the node record `node` """
+        if node['kwargs'].keys() <= _geometry_keys:
+            if node['type'] not in self._proto:
+                self._proto[node['type']] = _patch_style(Circle((0, 0), **{'radius' : 1, **self.node_types[node['type']]}).c)
+            return self._proto[node['type']]
+        return _patch_style(self._build_circle(node).c)
+        
+    @staticmethod
+    @lru_cache(maxsize = 4096)
+    def _gen_label(base, *args, bold = True):
+        if bold:
+            return _label_indexed_bold(base, args)
+        return _label_indexed_plain(base, args) if args else _label_bare(base)
             
-    def _render(self):
-        x, y = [[0, 0], [0, 0]]
-        
-        for r in self.rectangles.values():
-            x[0] = min(x[0], r.get_x())
-            x[1] = max(x[0], r.get_x() + r.get_width())
-            y[0] = min(y[0], r.get_y())
-            y[1] = max(y[0], r.get_y() + r.get_height())
+    def _render(self, reuse = False):
+        # Extents always include the origin, then every rectangle corner and node bounding box
+        lo, hi  = np.zeros(2), np.zeros(2)
+        if self.rectangles:
+            rects = np.array([(r.get_x(), r.get_y(), r.get_width(), r.get_height()) for r in self.rectangles.values()], dtype = float)
+            ends  = rects[:, :2] + rects[:, 2:]
+            lo    = np.minimum.reduce([lo, rects[:, :2].min(axis = 0), ends.min(axis = 0)])
+            hi    = np.maximum.reduce([hi, rects[:, :2].max(axis = 0), ends.max(axis = 0)])
             
-        for n in self.nodes.values():
-            x[0] = min(x[0], n.center[0] - n.radius)
-            x[1] = max(x[1], n.center[0] + n.radius)
-            y[0] = min(y[0], n.center[1] - n.radius)
-            y[1] = max(y[1], n.center[1] + n.radius)
+        centers = np.asarray(self._centers, dtype = float).reshape(-1, 2)
+        radii   = np.asarray(self._radii, dtype = float)
+        if len(radii):
+            node_lo = (centers - radii[:, None]).min(axis = 0)
+            node_hi = (centers + radii[:, None]).max(axis = 0)
+            lo      = np.minimum(lo, node_lo)
+            hi      = np.maximum(hi, node_hi)
             
-        fig = plt.figure(figsize = (x[1] - x[0], y[1] - y[0]))
-        ax  = fig.add_subplot(aspect = 'equal')
+        figsize = tuple((hi - lo).tolist())
+        if reuse and self._fig is not None and plt.fignum_exists(self._fig.number):
+            fig, ax = self._fig, self.ax
+            if tuple(fig.get_size_inches()) != figsize:
+                fig.set_size_inches(figsize)
+            ax.cla()
+            ax.set_aspect('equal')
+            plt.sca(ax)
+        else:
+            fig = plt.figure(figsize = figsize)
+            ax  = fig.add_subplot(aspect = 'equal')
+            self._draw_cid = None
         
-        for name, rect in self.rectangles.items():
-            ax.add_patch(rect)
-            plt.annotate(rect.get_label(), rect.label_position, ha = 'center', va = 'center', size = self.annot)
+        if self.annot:
+            for rect in self.rectangles.values():
+                ax.text(*rect.label_position, rect.get_label(), ha = 'center', va = 'center', size = self.annot)
         
-        for name, node in self.nodes.items():
-            node.add(ax)
+        # Rectangles go under the nodes in insertion order, runs of them are batched into one PatchCollection each. Semi-circle
+        # wedges are drawn as one PatchCollection, full circles as one EllipseCollection per distinct style. Rectangles and nodes
+        # using kwargs a collection cannot carry (e.g. hatch, zorder) are added as individual patches instead
+        rects = []
+        for rect in self.rectangles.values():
+            if rect.batched:
+                rects.append(rect)
+                continue
+            if rects:
+                ax.add_collection(PatchCollection(rects, match_original = True))
+                rects = []
+            _add_patch(ax, rect)
+        if rects:
+            ax.add_collection(PatchCollection(rects, match_original = True))
+            
+        patches = []
+        groups  = {}
+        semi    = []
+        artists = dict(key = self._artist_key(), patches = None, semi = semi, circles = [], node_patches = [], texts = [],
+                       arrows = [], arrow_patches = [], twins = [], twin_patches = [])
+        for i, node in enumerate(self.nodes.values()):
+            if not self._batchable(node):
+                for patch in self._build_circle(node).patches:
+                    artists['node_patches'].append((ax.add_patch(patch), i))
+                continue
+            if node['semi']:
+                patches.extend(self._build_circle(node).patches)
+                semi.append(i)
+                continue
+            style = self._node_style(node)
+            try:
+                groups.setdefault(style, (style, []))[1].append(i)
+            except TypeError: # unhashable line style, drawn on its own
+                groups[i] = style, [i]
+        if patches:
+            artists['patches'] = ax.add_collection(PatchCollection(patches, match_original = True))
+        for (fc, ec, lw, ls), idx in groups.values():
+            collection = EllipseCollection(2 * radii[idx], 2 * radii[idx], 0, units = 'xy', offsets = centers[idx],
+                                           offset_transform = ax.transData, facecolors = [fc], edgecolors = [ec],
+                                           linewidths = [lw], linestyles = [ls])
+            artists['circles'].append((ax.add_collection(collection), idx))
             
-        for A, D in self.connections.items():
-            for B, kwargs in D.items():
-                delta  = [b - a for a, b in zip(self.nodes[A].center, self.nodes[B].center)]
-                dist   = sum(d ** 2 for d in delta) ** 0.5
-                unit   = [d / dist for d in delta]
-                x, y   = [z + self.nodes[A].radius * u for z, u in zip(self.nodes[A].center, unit)]
-                diff   = dist - self.nodes[A].radius - self.nodes[B].radius
-                dx, dy = [u * diff for u in unit] 
-                arrow(x, y, dx, dy, **kwargs)
-        
-        ax.relim()
+        # Node labels were collected at insertion time, so they are drawn in a single pass
+        if self.annot:
+            artists['texts'] = [ax.text(x, y, label, ha = 'center', va = 'center', size = size) for x, y, label, size in self._labels]
+            
+        if self._edge_src:
+            src    = np.asarray(self._edge_src)
+            dst    = np.asarray(self._edge_dst)
+            types  = np.asarray(self._edge_type_id)
+            geom   = _edge_geometry(centers, radii, src, dst)
+            
+            # Group edge positions by type with one stable sort instead of a mask per type
+            order  = np.argsort(types, kind = 'stable')
+            bounds = np.searchsorted(types[order], np.arange(len(self._edge_types) + 1)).tolist()
+            
+            # Twin arrows are drawn individually, every other arrow is batched into one collection per connection type with the
+            # outlines built in one vectorised pass. Types using kwargs only a FancyArrow patch understands (e.g. hatch, zorder)
+            # are drawn as individual cached patches so those kwargs are kept
+            for t, connection_type in enumerate(self._edge_types):
+                kwargs = self.connection_types[connection_type]
+                idx    = order[bounds[t]:bounds[t + 1]]
+                if not len(idx):
+                    continue
+                rows = geom[idx].tolist() # plain floats, cheaper than NumPy scalars in the per-arrow code below
+                if kwargs.get('twin'):
+                    artists['twins'].append((kwargs, idx))
+                    artists['twin_patches'].extend(_draw_twins(ax, rows, kwargs))
+                    continue
+                style   = {k : v for k, v in kwargs.items() if k != 'twin'}
+                if style.keys() <= _arrow_shape_keys | _patch_keys:
+                    shape = {k : v for k, v in style.items() if k in _arrow_shape_keys}
+                    artists['arrows'].append((ax.add_collection(_arrow_collection(geom[idx], **style)), idx, shape))
+                    continue
+                patches = []
+                for i, (x, y, dx, dy) in zip(idx.tolist(), rows):
+                    cached = self._arrow_patches.get(i)
+                    if cached is not None and cached[0] == t:
+                        patch = cached[1]
+                        patch.set_data(x = x, y = y, dx = dx, dy = dy)
+                    else:
+                        patch = FancyArrow(x, y, dx, dy, **style)
+                        self._arrow_patches[i] = t, patch
+                    patches.append(_add_patch(ax, patch))
+                artists['arrow_patches'].append((idx, patches))
+        
+        # EllipseCollection only contributes its offsets to the data limits, so add the node extents before autoscaling
+        if len(radii):
+            ax.update_datalim([node_lo, node_hi])
         ax.autoscale_view()
         ax.axis('off')
         
-        self.ax = ax
+        self.ax          = ax
+        self._fig        = fig
+        self._artists    = artists
+        self._background = None
         
         return self
+        
+    def _artist_key(self):
+        """ Snapshot of the graph structure, `update` can only move artists rendered from the same structure """
+        return len(self._centers), len(self.rectangles), list(self._edge_type_id)
     
     def add_node(self, name, xy, node_type = None, **kwargs):
+        if name in self.nodes:
+            raise KeyError(name)
         self._add_node(name, xy, node_type, **kwargs)
         
     def add_connection(self, A, B, connection_type = None):
+        for key in (A, B):
+            if key not in self.nodes:
+                raise KeyError(key)
         self._add_connection(A, B, connection_type)
         
     def add_rectangle(self, name, xy, width, height, rectangle_type = None, **kwargs):
+        if name in self.rectangles:
+            raise KeyError(name)
         self._add_rectangle(name, xy, width, height, rectangle_type, **kwargs)
                             
-    def render(self):
-        return self._render()
\ No newline at end of file
+    def render(self, idle = False, reuse = False):
+        self._render(reuse)
+        if idle:
+            self._fig.canvas.draw_idle()
+        return self
+        
+    def update(self, positions = None, blit = False):
+        nodes, centers = self.nodes, self._centers
+        delta          = np.zeros((len(centers), 2))
+        for name, xy in (positions or {}).items():
+            i          = self._name_to_idx[name]
+            x, y       = xy
+            delta[i]   = x - centers[i][0], y - centers[i][1]
+            centers[i] = nodes[name]['xy'] = x, y
+        if positions and self._labels:
+            shift        = delta[self._label_node].tolist()
+            self._labels = [(x + dx, y + dy, label, size) for (x, y, label, size), (dx, dy) in zip(self._labels, shift)]
+            
+        artists = self._artists
+        fig     = self._fig
+        if artists is None or not plt.fignum_exists(fig.number) or artists['key'] != self._artist_key():
+            return self.render(idle = True, reuse = True)
+        
+        # Move the cached artists in place, only the twin arrows are redrawn
+        ax      = self.ax
+        centers = np.asarray(centers, dtype = float).reshape(-1, 2)
+        radii   = np.asarray(self._radii, dtype = float)
+        for collection, idx in artists['circles']:
+            collection.set_offsets(centers[idx])
+        for patch, i in artists['node_patches']:
+            patch.set_center(centers[i])
+        if artists['patches'] is not None:
+            records = list(nodes.values())
+            patches = []
+            for i in artists['semi']:
+                patches.extend(self._build_circle(records[i]).patches)
+            artists['patches'].set_paths(patches)
+        for text, (x, y, label, size) in zip(artists['texts'], self._labels):
+            text.set_position((x, y))
+            
+        if self._edge_src:
+            geom = _edge_geometry(centers, radii, np.asarray(self._edge_src), np.asarray(self._edge_dst))
+            for collection, idx, shape in artists['arrows']:
+                collection.set_verts(_arrow_polygons(geom[idx], **shape))
+            for idx, patches in artists['arrow_patches']:
+                for patch, (x, y, dx, dy) in zip(patches, geom[idx].tolist()):
+                    patch.set_data(x = x, y = y, dx = dx, dy = dy)
+            for patch in artists['twin_patches']:
+                patch.remove()
+            artists['twin_patches'] = [p for kwargs, idx in artists['twins'] for p in _draw_twins(ax, geom[idx].tolist(), kwargs)]
+            
+        canvas = fig.canvas
+        if not (blit and canvas.supports_blit):
+            canvas.draw_idle()
+            return self
+        
+        # Everything that moves is drawn over a cached background of the static artists. The artists are only animated while
+        # blitting so that normal draws (pan, zoom, resize, savefig, later updates) still include them, and any such draw drops
+        # the background as it may no longer match the canvas
+        if self._draw_cid is None:
+            self._draw_cid = canvas.mpl_connect('draw_event', self._drop_background)
+        dynamic = [artists['patches'], *(c for c, _ in artists['circles']), *(p for p, _ in artists['node_patches']),
+                   *artists['texts'], *(c for c, *_ in artists['arrows']),
+                   *(p for _, patches in artists['arrow_patches'] for p in patches), *artists['twin_patches']]
+        dynamic = [a for a in dynamic if a is not None]
+        for a in dynamic:
+            a.set_animated(True)
+        try:
+            if self._background is None:
+                canvas.draw()
+                self._background = canvas.copy_from_bbox(ax.bbox)
+            canvas.restore_region(self._background)
+            for a in dynamic:
+                ax.draw_artist(a)
+            canvas.blit(ax.bbox)
+        finally:
+            for a in dynamic:
+                a.set_animated(False)
+        return self
+        
+    def _drop_background(self, event):
+        """ draw_event callback invalidating the blitting background """
+        self._background = None